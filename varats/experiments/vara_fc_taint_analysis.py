@@ -7,14 +7,18 @@ instructions tainted by the commit regions of the cpp file.
 """
 
 import typing as tp
+import fcntl
+import subprocess
+from functools import partial
 
 from typing import List
 from plumbum import ProcessExecutionError
+from plumbum.commands.base import BoundCommand
 
 import benchbuild.utils.actions as actions
 from benchbuild.settings import CFG as BB_CFG
 from benchbuild.project import Project
-from benchbuild.utils.cmd import rm, echo, FileCheck
+from benchbuild.utils.cmd import rm, FileCheck
 from varats.experiments.vara_full_mtfa import VaRATaintPropagation
 from varats.data.reports.taint_report import TaintPropagationReport as TPR
 from varats.data.report import FileStatusExtension as FSE
@@ -22,6 +26,41 @@ from varats.utils.experiment_util import (exec_func_with_pe_error_handler,
                                           PEErrorHandler)
 
 
+# fcntl constant to resize a pipe, available since Linux 2.6.35.
+F_SETPIPE_SZ = 1031
+
+# 1 MiB instead of the 64 KiB Linux default, so FileCheck is not woken up
+# for every small pipe refill on large instruction streams.
+PIPE_BUF_SIZE = 1 << 20
+
+
+def _run_filecheck_piped(file_check_cmd: BoundCommand, input_str: str,
+                         result_file_path: str) -> None:
+    """
+    Run FileCheck with ``input_str`` on an enlarged stdin pipe and stdout
+    redirected into the result file. The process is spawned through
+    plumbum, so the PATH/LD_LIBRARY_PATH env benchbuild attaches to its
+    commands still applies.
+
+    Raises:
+        ProcessExecutionError: if FileCheck exits with a non-zero code,
+                               mirroring plumbum's behaviour
+    """
+    with open(result_file_path, "wb") as result_file:
+        proc = file_check_cmd.popen(stdin=subprocess.PIPE,
+                                    stdout=result_file,
+                                    stderr=subprocess.PIPE)
+        try:
+            fcntl.fcntl(proc.stdin.fileno(), F_SETPIPE_SZ, PIPE_BUF_SIZE)
+        except OSError:
+            # Best effort; fall back to the default pipe size.
+            pass
+        _, stderr = proc.communicate(input_str.encode())
+    if proc.returncode != 0:
+        raise ProcessExecutionError(file_check_cmd.formulate(),
+                                    proc.returncode, "", stderr.decode())
+
+
 class ParseAndValidateVaRAOutput(actions.Step):  # type: ignore
     """
     Read the LLVM IR, store the tainted ones and pipe them into FileCheck.
@@ -115,22 +154,24 @@ class ParseAndValidateVaRAOutput(actions.Step):  # type: ignore
             for inst in tainted_instructions:
                 array_string.join(inst)
 
-            file_check_cmd = FileCheck["{fc_dir}/{fc_exp_file}".format(
-                fc_dir=tmp_repo_dir, fc_exp_file=expected_file)]
+            check_file_path = "{fc_dir}/{fc_exp_file}".format(
+                fc_dir=tmp_repo_dir, fc_exp_file=expected_file)
+            result_file_path = "{res_folder}/{res_file}".format(
+                res_folder=result_folder, res_file=result_file)
 
-            cmd_chain = (echo[array_string] | file_check_cmd >
-                         "{res_folder}/{res_file}".format(
-                             res_folder=result_folder, res_file=result_file))
+            # Feed the instructions to FileCheck via stdin through an
+            # enlarged pipe instead of spawning an extra echo process.
+            file_check_cmd = FileCheck[check_file_path]
 
             try:
                 exec_func_with_pe_error_handler(
-                    cmd_chain,
-                    PEErrorHandler(result_folder, error_file, cmd_chain,
+                    partial(_run_filecheck_piped, file_check_cmd,
+                            array_string, result_file_path),
+                    PEErrorHandler(result_folder, error_file, file_check_cmd,
                                    timeout_duration))
             # remove the success file on error in the filecheck.
             except ProcessExecutionError:
-                rm("{res_folder}/{res_file}".format(res_folder=result_folder,
-                                                    res_file=result_file))
+                rm(result_file_path)
 
 
 class VaRAFileCheckTaintPropagation(VaRATaintPropagation):
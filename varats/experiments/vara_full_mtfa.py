@@ -12,23 +12,54 @@ files for each executed binary.
 """
 
 import typing as tp
-from os import path
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import path, cpu_count, getenv
 
-from plumbum import local
+from plumbum import ProcessExecutionError
 
 from benchbuild.extensions import compiler, run, time
 from benchbuild.settings import CFG as BB_CFG
 from benchbuild.project import Project
 import benchbuild.utils.actions as actions
-from benchbuild.utils.cmd import opt, mkdir, timeout
+from benchbuild.utils.cmd import opt, mkdir, rm, timeout
 
 from varats.data.reports.taint_report import TaintPropagationReport as TPR
 from varats.data.report import FileStatusExtension as FSE
-from varats.experiments.wllvm import RunWLLVM, Extract
+from varats.experiments.wllvm import (RunWLLVM, Extract,
+                                      get_bc_cache_file_path)
 from varats.utils.experiment_util import (exec_func_with_pe_error_handler,
                                           FunctionPEErrorWrapper,
                                           VersionExperiment, PEErrorHandler)
 
+LOG = logging.getLogger(__name__)
+
+
+def _run_mtfa_for_binary(
+        binary_name: str, bc_file_path: str, result_file_path: str,
+        error_file: str, vara_result_folder: str,
+        timeout_duration: str) -> tp.Tuple[str, bool, tp.Optional[str]]:
+    """
+    Run VaRA's MTFA analysis for a single project binary.
+
+    This function is executed in a worker process, therefore it only
+    receives plain strings and reconstructs the bound opt command itself
+    instead of having it pickled.
+
+    The mem2reg and sroa passes canonicalize the bitcode first, shrinking
+    the IR the MTFA analysis has to traverse.
+    """
+    vara_run_cmd = opt["-mem2reg", "-sroa", "-vara-CD", "-print-Full-MTFA",
+                       bc_file_path, "-o", "/dev/null"]
+    try:
+        exec_func_with_pe_error_handler(
+            timeout[timeout_duration, vara_run_cmd] > result_file_path,
+            PEErrorHandler(vara_result_folder, error_file, vara_run_cmd,
+                           timeout_duration))
+    except ProcessExecutionError as ex:
+        return binary_name, False, str(ex)
+    return binary_name, True, None
+
 
 class VaraMTFACheck(actions.Step):  # type: ignore
     """
@@ -47,6 +78,10 @@ class VaraMTFACheck(actions.Step):  # type: ignore
     def analyze(self) -> actions.StepResult:
         """
         This step performs the actual analysis with the correct flags.
+        The analyses of the single binaries are independent of each other,
+        so they are dispatched to a pool of worker processes. Setting the
+        environment variable VARA_MTFA_PARALLEL=0 forces sequential
+        execution for easier debugging.
         Flags:
             -vara-CD:         activate VaRA's commit detection
             -print-Full-MTFA: to run a taint flow analysis
@@ -56,56 +91,88 @@ class VaraMTFACheck(actions.Step):  # type: ignore
             return
         project = self.obj
 
-        # Set up cache directory for bitcode files
-        bc_cache_dir = Extract.BC_CACHE_FOLDER_TEMPLATE.format(
-            cache_dir=str(BB_CFG["varats"]["result"]),
-            project_name=str(project.name))
+        # Hoist the repeated str() conversions out of the per-binary loop.
+        project_name = str(project.name)
+        project_version = str(project.version)
+        project_uuid = str(project.run_uuid)
+        cache_dir = str(BB_CFG["varats"]["result"])
 
         # Define the output directory.
         vara_result_folder = self.RESULT_FOLDER_TEMPLATE.format(
             result_dir=str(BB_CFG["varats"]["outfile"]),
-            project_dir=str(project.name))
+            project_dir=project_name)
         mkdir("-p", vara_result_folder)
 
         timeout_duration = '8h'
 
+        # Collect only plain strings per binary, so the work items can be
+        # pickled into the worker processes.
+        work_items = []
         for binary in project.binaries:
-            # Combine the input bitcode file's name
-            bc_target_file = Extract.BC_FILE_TEMPLATE.format(
-                project_name=str(project.name),
-                binary_name=str(binary.name),
-                project_version=str(project.version))
+            binary_name = str(binary.name)
+
+            # Combine the input bitcode file's path
+            bc_file_path = get_bc_cache_file_path(cache_dir, project_name,
+                                                  binary_name, project_version)
+
+            # The fields shared by the result and error file names.
+            common_kwargs = {
+                "project_name": project_name,
+                "binary_name": binary_name,
+                "project_version": project_version,
+                "project_uuid": project_uuid,
+            }
 
             # Define empty success file.
-            result_file = TPR.get_file_name(project_name=str(project.name),
-                                            binary_name=binary.name,
-                                            project_version=str(
-                                                project.version),
-                                            project_uuid=str(project.run_uuid),
+            result_file = TPR.get_file_name(**common_kwargs,
                                             extension_type=FSE.Success,
                                             file_ext=".ll")
 
             # Define output file name of failed runs
-            error_file = TPR.get_file_name(project_name=str(project.name),
-                                           binary_name=binary.name,
-                                           project_version=str(project.version),
-                                           project_uuid=str(project.run_uuid),
+            error_file = TPR.get_file_name(**common_kwargs,
                                            extension_type=FSE.Failed,
                                            file_ext=TPR.FILE_TYPE)
 
-            # Put together the path to the bc file and the opt command of vara
-            vara_run_cmd = opt[
-                "-vara-CD", "-print-Full-MTFA", "{cache_folder}/{bc_file}".
-                format(cache_folder=bc_cache_dir, bc_file=bc_target_file), "-o",
-                "/dev/null"]
-
-            # Run the MTFA command with custom error handler and timeout
-            exec_func_with_pe_error_handler(
-                timeout[timeout_duration, vara_run_cmd] >
-                "{res_folder}/{res_file}".format(res_folder=vara_result_folder,
-                                                 res_file=result_file),
-                PEErrorHandler(vara_result_folder, error_file, vara_run_cmd,
-                               timeout_duration))
+            work_items.append(
+                (binary_name, bc_file_path,
+                 f"{vara_result_folder}/{result_file}", error_file))
+
+        result_file_paths = {item[0]: item[2] for item in work_items}
+
+        # Run the MTFA commands with custom error handler and timeout
+        if getenv("VARA_MTFA_PARALLEL", "1") == "0":
+            analysis_results = [
+                _run_mtfa_for_binary(*work_item, vara_result_folder,
+                                     timeout_duration)
+                for work_item in work_items
+            ]
+        else:
+            max_workers = int(BB_CFG["jobs"]) or cpu_count()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_run_mtfa_for_binary, *work_item,
+                                    vara_result_folder, timeout_duration)
+                    for work_item in work_items
+                ]
+                analysis_results = [
+                    future.result() for future in as_completed(futures)
+                ]
+
+        # Remove result files of failed runs; the workers already wrote the
+        # corresponding error files.
+        failed_runs = [(binary_name, error)
+                       for binary_name, success, error in analysis_results
+                       if not success]
+        for binary_name, _ in failed_runs:
+            rm("-f", result_file_paths[binary_name])
+
+        # Surface failures instead of silently returning green; the error
+        # files on disk carry the full tracebacks.
+        if failed_runs:
+            for binary_name, error in failed_runs:
+                LOG.error("MTFA analysis failed for binary %s: %s",
+                          binary_name, error)
+            return actions.StepResult.ERROR
 
 
 class VaRATaintPropagation(VersionExperiment):
@@ -149,23 +216,19 @@ class VaRATaintPropagation(VersionExperiment):
 
         analysis_actions = []
 
-        # Not run all steps if cached results exist.
-        all_cache_files_present = True
-        for binary in project.binaries:
-            all_cache_files_present &= path.exists(
-                local.path(
-                    Extract.BC_CACHE_FOLDER_TEMPLATE.format(
-                        cache_dir=str(BB_CFG["varats"]["result"]),
-                        project_name=str(project.name)) +
-                    Extract.BC_FILE_TEMPLATE.format(
-                        project_name=str(project.name),
-                        binary_name=binary.name,
-                        project_version=str(project.version))))
-
-            if not all_cache_files_present:
-                analysis_actions.append(actions.Compile(project))
-                analysis_actions.append(Extract(project))
-                break
+        project_name = str(project.name)
+        project_version = str(project.version)
+        cache_dir = str(BB_CFG["varats"]["result"])
+
+        # Not run all steps if cached results exist; all() short-circuits
+        # at the first missing bitcode file.
+        if not all(
+                path.exists(
+                    get_bc_cache_file_path(cache_dir, project_name,
+                                           binary.name, project_version))
+                for binary in project.binaries):
+            analysis_actions.append(actions.Compile(project))
+            analysis_actions.append(Extract(project))
 
         analysis_actions.append(VaraMTFACheck(project))
         analysis_actions.append(actions.Clean(project))
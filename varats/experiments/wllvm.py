@@ -9,6 +9,7 @@ the generated bc files with LLVM.
 """
 
 import typing as tp
+from functools import lru_cache
 from os import getenv
 from pathlib import Path
 
@@ -87,19 +88,42 @@ class Extract(actions.Step):  # type: ignore
             return
         project = self.obj
 
-        bc_cache_folder = self.BC_CACHE_FOLDER_TEMPLATE.format(
-            cache_dir=str(BB_CFG["varats"]["result"]),
-            project_name=str(project.name))
+        cache_dir = str(BB_CFG["varats"]["result"])
+        project_name = str(project.name)
+
+        bc_cache_folder = get_bc_cache_dir(cache_dir, project_name)
         mkdir("-p", local.path() / bc_cache_folder)
 
         for binary in project.binaries:
-            bc_cache_file = bc_cache_folder + self.BC_FILE_TEMPLATE.format(
-                project_name=str(project.name),
-                binary_name=str(binary.name),
-                project_version=str(project.version))
+            bc_cache_file = get_bc_cache_file_path(cache_dir, project_name,
+                                                   str(binary.name),
+                                                   str(project.version))
 
             target_binary = Path(project.builddir) / project.SRC_FILE /\
                 binary
 
             extract_bc(target_binary)
             cp(str(target_binary) + ".bc", local.path() / bc_cache_file)
+
+
+@lru_cache(maxsize=1024)
+def get_bc_cache_dir(cache_dir: str, project_name: str) -> str:
+    """
+    Get the bitcode cache directory of a project. Memoized because the
+    experiments query the same (cache dir, project) pair once per binary
+    and rerun.
+    """
+    return Extract.BC_CACHE_FOLDER_TEMPLATE.format(cache_dir=cache_dir,
+                                                   project_name=project_name)
+
+
+@lru_cache(maxsize=1024)
+def get_bc_cache_file_path(cache_dir: str, project_name: str, binary_name: str,
+                           project_version: str) -> str:
+    """
+    Get the full path of a cached bitcode file.
+    """
+    return get_bc_cache_dir(cache_dir, project_name) + \
+        Extract.BC_FILE_TEMPLATE.format(project_name=project_name,
+                                        binary_name=binary_name,
+                                        project_version=project_version)
@@ -1,12 +1,13 @@
 """
 Project file for glibc.
 """
+import hashlib
 import typing as tp
 from pathlib import Path
 
 from benchbuild.project import Project
 from benchbuild.settings import CFG as BB_CFG
-from benchbuild.utils.cmd import make
+from benchbuild.utils.cmd import git, make
 from benchbuild.utils.compiler import cc
 from benchbuild.utils.download import with_git
 from benchbuild.utils.run import run
@@ -15,7 +16,8 @@ from plumbum import local
 
 from varats.data.provider.cve.cve_provider import CVEProviderHook
 from varats.paper.paper_config import project_filter_generator
-from varats.utils.project_util import wrap_paths_to_binaries
+from varats.utils.project_util import (wrap_compiler_with_ccache,
+                                       wrap_paths_to_binaries)
 
 
 @with_git("git://sourceware.org/git/glibc.git",
@@ -45,10 +47,24 @@ class Glibc(Project, CVEProviderHook):  # type: ignore
 
         clang = cc(self)
         local.path(self.SRC_FILE + "/" + "build").mkdir()
+
+        with local.cwd(self.SRC_FILE):
+            git_rev = git("rev-parse", "HEAD").strip()
+
+        # Configure is single-threaded and dominates warm rebuilds, so skip
+        # it when neither the compiler nor the checked-out revision changed.
+        cfg_key = hashlib.sha1(f"{clang}:{git_rev}".encode()).hexdigest()
+
         with local.cwd(self.SRC_FILE + "/" + "build"):
-            with local.env(CC=str(clang)):
-                run(local["./../configure"])
-            run(make["-j", int(BB_CFG["jobs"])])
+            cfg_key_file = local.path(".cfg_key")
+            if not (cfg_key_file.exists() and
+                    cfg_key_file.read().strip() == cfg_key):
+                with local.env(CC=wrap_compiler_with_ccache(
+                        self, str(clang))):
+                    run(local["./../configure"])
+                cfg_key_file.write(cfg_key)
+            jobs = int(BB_CFG["jobs"])
+            run(make["-j", jobs, "-l", jobs])
 
     @classmethod
     def get_cve_product_info(cls) -> tp.List[tp.Tuple[str, str]]:
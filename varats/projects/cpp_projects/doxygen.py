@@ -8,14 +8,15 @@ from benchbuild.settings import CFG as BB_CFG
 from benchbuild.utils.compiler import cxx
 from benchbuild.utils.run import run
 from benchbuild.project import Project
-from benchbuild.utils.cmd import make, cmake, cp
+from benchbuild.utils.cmd import cmake, cp, ninja
 from benchbuild.utils.download import with_git
 
 from plumbum.path.utils import delete
 from plumbum import local
 
 from varats.paper.paper_config import project_filter_generator
-from varats.utils.project_util import (wrap_paths_to_binaries, block_revisions,
+from varats.utils.project_util import (wrap_compiler_with_ccache,
+                                       wrap_paths_to_binaries, block_revisions,
                                        BugAndFixPair)
 
 
@@ -55,10 +56,13 @@ class Doxygen(Project):  # type: ignore
 
         clangxx = cxx(self)
         with local.cwd(self.SRC_FILE):
-            with local.env(CXX=str(clangxx)):
+            with local.env(CXX=wrap_compiler_with_ccache(
+                    self, str(clangxx))):
                 delete("CMakeCache.txt")
-                cmake("-G", "Unix Makefiles", ".")
-            run(make["-j", int(BB_CFG["jobs"])])
+                # Ninja schedules the many C++ translation units better
+                # than recursive make.
+                cmake("-G", "Ninja", ".")
+            run(ninja["-j", int(BB_CFG["jobs"])])
 
             cp("bin/doxygen", ".")
 
@@ -5,13 +5,10 @@ Driver module for `vara-buildsetup`.
 import typing as tp
 import argparse
 import os
+import shutil
 import sys
 from pathlib import Path
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication
-
-from varats.gui.buildsetup_window import BuildSetup
 from varats.settings import get_value_or_default, CFG, save_config
 from varats.vara_manager import BuildType
 from varats.utils.cli_util import (initialize_logger_config, get_research_tool,
@@ -26,18 +23,30 @@ class VaRATSSetup:
     """
 
     def __init__(self) -> None:
-        if hasattr(Qt, 'AA_EnableHighDpiScaling'):
-            QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
-            QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        # Only remember the HiDPI settings; importing Qt widgets and
+        # constructing the QApplication loads the whole Qt platform stack
+        # and is deferred until the GUI actually starts.
+        from PyQt5.QtCore import Qt
 
-        self.app = QApplication(sys.argv)
-        self.main_window = BuildSetup()
+        self.enable_high_dpi_scaling = hasattr(Qt, 'AA_EnableHighDpiScaling')
+        self.use_high_dpi_pixmaps = hasattr(Qt, 'AA_UseHighDpiPixmaps')
 
     def main(self) -> None:
         """
         Start VaRA setup GUI
         """
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtWidgets import QApplication
+
+        from varats.gui.buildsetup_window import BuildSetup
+
+        if self.enable_high_dpi_scaling:
+            QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        if self.use_high_dpi_pixmaps:
+            QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
+        self.app = QApplication(sys.argv)
+        self.main_window = BuildSetup()
         sys.exit(self.app.exec_())
 
 
@@ -53,12 +62,21 @@ def update_term(text: str, enable_inline: bool = False) -> None:
     if not text:
         return
     if enable_inline:
-        _, columns = os.popen('/bin/stty size', 'r').read().split()
-        print(text, end=(int(columns) - len(text) - 1) * ' ' + '\r', flush=True)
+        columns = shutil.get_terminal_size((80, 24)).columns
+        print(text, end=(columns - len(text) - 1) * ' ' + '\r', flush=True)
     else:
         print(text)
 
 
+_BUILD_TYPE_MAP: tp.Dict[str, BuildType] = {
+    "DBG": BuildType.DBG,
+    "DEV": BuildType.DEV,
+    "OPT": BuildType.OPT,
+    "PGO": BuildType.PGO,
+    "DEV-SAN": BuildType.DEV_SAN,
+}
+
+
 def parse_string_to_build_type(build_type: str) -> BuildType:
     """
     Convert a string into a BuildType
@@ -88,19 +106,7 @@ def parse_string_to_build_type(build_type: str) -> BuildType:
     >>> parse_string_to_build_type("DEV-SAN")
     <BuildType.DEV_SAN: 5>
     """
-    build_type = build_type.upper()
-    if build_type == "DBG":
-        return BuildType.DBG
-    if build_type == "DEV":
-        return BuildType.DEV
-    if build_type == "OPT":
-        return BuildType.OPT
-    if build_type == "PGO":
-        return BuildType.PGO
-    if build_type == "DEV-SAN":
-        return BuildType.DEV_SAN
-
-    return BuildType.DEV
+    return _BUILD_TYPE_MAP.get(build_type.upper(), BuildType.DEV)
 
 
 def main() -> None:
@@ -10,9 +10,9 @@ from pathlib import Path
 
 from varats.vara_manager import (
     BuildType, download_repo, add_remote, checkout_branch, checkout_new_branch,
-    fetch_remote, init_all_submodules, update_all_submodules,
-    pull_current_branch, show_status, branch_has_upstream, push_current_branch,
-    get_current_branch, has_branch, has_remote_branch, get_branches)
+    fetch_remote, update_all_submodules, pull_current_branch, show_status,
+    branch_has_upstream, push_current_branch, get_current_branch, has_branch,
+    has_remote_branch, get_branches)
 from varats.utils.logger_util import log_without_linsep
 from varats.utils.filesystem_util import FolderAlreadyPresentError
 
@@ -90,7 +90,6 @@ class SubProject():
         Args:
             cb_base_dir: base directory for the ``CodeBase``
         """
-        init_all_submodules(self.__parent_code_base.base_dir / self.path)
         update_all_submodules(self.__parent_code_base.base_dir / self.path)
 
     def clone(self) -> None:
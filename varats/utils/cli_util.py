@@ -8,7 +8,6 @@ import os
 from pathlib import Path
 
 from varats.tools.research_tools.research_tool import ResearchTool
-from varats.tools.research_tools.vara import VaRA
 from varats.settings import CFG
 
 
@@ -52,6 +51,9 @@ def get_research_tool(
         otherwise, raises LookupError
     """
     if name in ("VaRA", "vara"):
+        # Only import the research tool that is actually requested.
+        from varats.tools.research_tools.vara import VaRA
+
         return VaRA(source_location if source_location is not None else Path(
             CFG["vara"]["llvm_source_dir"].value))
 
@@ -4,6 +4,7 @@ Utility module for BenchBuild project handling.
 import abc
 from enum import IntFlag
 from pathlib import Path
+import shutil
 import typing as tp
 import tempfile
 
@@ -99,6 +100,29 @@ def get_all_revisions_between(c_start: str, c_end: str) -> tp.List[str]:
     return result
 
 
+def wrap_compiler_with_ccache(project: Project, compiler: str) -> str:
+    """
+    Prefix a compiler invocation with ccache, if ccache is installed.
+
+    Rebuilds of unchanged sources across experiment reruns then hit the
+    compiler cache instead of running preprocessing and code generation
+    again. Benchbuild's cc/cxx return a generated wrapper script that runs
+    the experiment's compiler-extension chain, e.g. RunWLLVM emitting
+    bitcode side outputs; a ccache hit would replay a stored object
+    without running those extensions, so the compiler is returned
+    unchanged whenever an extension is active.
+
+    Args:
+        project: the project that invokes the compiler
+        compiler: the compiler command to wrap
+    """
+    if getattr(project, "compiler_extension", None) is not None:
+        return compiler
+    if shutil.which("ccache"):
+        return "ccache " + compiler
+    return compiler
+
+
 def wrap_paths_to_binaries(binaries: tp.List[str]) -> tp.List[Path]:
     """
     Generates a wrapper for project binaries.
@@ -330,11 +330,9 @@ def setup_vara(init: bool,
             checkout_vara_version(llvm_folder, include_phasar, version,
                                   use_dev_branches)
             if own_libgit:
-                init_all_submodules(llvm_folder / LLVMProjects.vara.path)
                 update_all_submodules(llvm_folder / LLVMProjects.vara.path)
 
             if include_phasar:
-                init_all_submodules(llvm_folder / LLVMProjects.phasar.path)
                 update_all_submodules(llvm_folder / LLVMProjects.phasar.path)
 
     if not os.path.exists(llvm_folder):
@@ -429,23 +427,29 @@ def fetch_remote(remote: tp.Optional[str] = None,
         pass
 
 
-def init_all_submodules(folder: Path) -> None:
-    """
-    Inits all submodules.
-    """
-    with ProcessManager.create_process("git", ["submodule", "init"],
-                                       workdir=folder):
-        pass
-
-
 def update_all_submodules(folder: Path) -> None:
     """
     Updates all submodules.
-    """
-    with ProcessManager.create_process("git", ["submodule", "update"],
-                                       workdir=folder):
+
+    Missing submodules are initialized on the fly and all fetches run in
+    parallel with a history depth of one, which requires git >= 2.8.
+    Shallow fetches only reach submodules pinned to a commit behind the
+    fetched tip if the server allows direct SHA1 fetches, so the update
+    is retried with full history when the shallow attempt fails.
+    """
+    base_args = [
+        "submodule", "update", "--init", "--recursive", "--jobs",
+        str(os.cpu_count() or 1)
+    ]
+    with ProcessManager.create_process("git",
+                                       base_args + ["--depth", "1"],
+                                       workdir=folder) as proc:
         pass
 
+    if proc.exitCode() != 0:
+        with ProcessManager.create_process("git", base_args, workdir=folder):
+            pass
+
 
 def pull_current_branch(repo_folder: tp.Optional[Path] = None) -> None:
     """
@@ -687,11 +691,9 @@ def verify_build_structure(own_libgit: bool, include_phasar: bool,
     if (not get_cmake_var("VARA_BUILD_LIBGIT") or not os.path.exists(
             path_to_llvm / "/tools/VaRA/external/libgit2/CMakeLists.txt")) \
             and own_libgit:
-        init_all_submodules(path_to_llvm / LLVMProjects.vara.path)
         update_all_submodules(path_to_llvm / LLVMProjects.vara.path)
 
     if include_phasar:
-        init_all_submodules(path_to_llvm / LLVMProjects.phasar.path)
         update_all_submodules(path_to_llvm / LLVMProjects.phasar.path)
 
 